@@ -1,18 +1,38 @@
+from operator import itemgetter
+
 import streamlit as st
-import pandas as pd
 
-# Page configuration
+from pricing_core import compute_pricing
+
+# Static UI strings
+_PAGE_TITLE = "Nursery Pricing Calculator"
+_PAGE_ICON = "🌱"
+_INTRO_TEXT = "Calculate optimal pricing for your nursery products with built-in profit margins"
+_DESKTOP_VIEW_HELP = "Switch to two-column layout for desktop"
+_PLANT_HELP = "Wholesale cost or cost to grow this plant"
+_PACKAGING_HELP = "Box, padding, protective materials for shipping"
+_SALES_DISCOUNT_HELP = "Discount applied to final price"
+_MIN_SALES_PROFIT_HELP = "Lowest profit margin allowed during sales"
+_GST_HELP = "Add Australian GST to final price"
+
+
+def _d(x):
+    """Format a dollar amount, e.g. $12.50."""
+    return f"${x:.2f}"
+
+
+# Page configuration - must stay the first Streamlit call
 st.set_page_config(
-    page_title="Nursery Pricing Calculator",
-    page_icon="🌱",
+    page_title=_PAGE_TITLE,
+    page_icon=_PAGE_ICON,
     layout="wide"  # Better responsive behavior
 )
 
-st.title("🌱 Nursery Pricing Calculator")
-st.write("Calculate optimal pricing for your nursery products with built-in profit margins")
+st.title(f"{_PAGE_ICON} {_PAGE_TITLE}")
+st.write(_INTRO_TEXT)
 
 # Desktop view toggle - mobile is default
-desktop_view = st.checkbox("🖥️ Desktop View", value=False, help="Switch to two-column layout for desktop")
+desktop_view = st.checkbox("🖥️ Desktop View", value=False, help=_DESKTOP_VIEW_HELP)
 st.write("---")
 
 # Mobile-first layout - single column by default, two columns for desktop
@@ -28,206 +48,194 @@ else:
 
 with input_container:
     st.header("💰 Cost Inputs")
-    
-    # Plant costs
-    plant_cost = st.number_input(
-        "Plant Cost ($)", 
-        min_value=0.0, 
-        value=5.0, 
-        step=0.50,
-        help="Wholesale cost or cost to grow this plant"
-    )
-    
-    # Materials costs
-    st.subheader("Materials & Care")
-    pot_cost = st.number_input("Pot/Container ($)", min_value=0.0, value=2.0, step=0.25)
-    soil_cost = st.number_input("Soil/Growing Medium ($)", min_value=0.0, value=1.0, step=0.25)
-    fertilizer_cost = st.number_input("Fertilizer/Care Products ($)", min_value=0.0, value=0.50, step=0.25)
-    packaging_cost = st.number_input("Packaging/Shipping Materials ($)", min_value=0.0, value=1.50, step=0.25, 
-                                   help="Box, padding, protective materials for shipping")
-    other_materials = st.number_input("Other Materials ($)", min_value=0.0, value=0.0, step=0.25)
-    
-    # Time investment
-    st.subheader("Time Investment")
-    care_hours = st.number_input("Care/Prep Hours", min_value=0.0, value=1.0, step=0.25)
-    hourly_rate = st.number_input("Your Hourly Rate ($)", min_value=0.0, value=20.0, step=5.0)
-    
-    # Pricing settings - ALL INPUT VARIABLES DEFINED HERE
-    st.subheader("Pricing Settings")
-    profit_margin = st.slider("Desired Profit Margin (%)", min_value=20, max_value=100, value=30, step=5)
-    sales_discount = st.slider("Sales Discount (%)", min_value=0, max_value=50, value=0, step=5,
-                              help="Discount applied to final price")
-    minimum_sales_profit = st.slider("Minimum Sales Profit (%)", min_value=0, max_value=20, value=10, step=1,
-                                    help="Lowest profit margin allowed during sales")
-    include_gst = st.checkbox("Add GST (10%)", value=True, help="Add Australian GST to final price")
-
-# ALL INPUT VARIABLES NOW DEFINED - START CALCULATIONS
-# Step 1: Calculate total costs
-total_material_cost = pot_cost + soil_cost + fertilizer_cost + packaging_cost + other_materials
-time_cost = care_hours * hourly_rate
-total_cost = plant_cost + total_material_cost + time_cost
-
-# Step 2: Calculate base selling price (before GST, before discount)
-base_selling_price = total_cost / (1 - profit_margin/100)
-
-# Step 3: Add GST to get list price
-if include_gst:
-    gst_amount = base_selling_price * 0.10
-    list_price = base_selling_price + gst_amount
-else:
-    gst_amount = 0.0
-    list_price = base_selling_price
 
-# Step 4: Apply discount to list price
-if sales_discount > 0:
-    discounted_price = list_price * (1 - sales_discount/100)
-    
-    # Calculate minimum allowable price
-    min_price_before_gst = total_cost / (1 - minimum_sales_profit/100) if minimum_sales_profit > 0 else total_cost
-    min_allowable_price = min_price_before_gst * 1.10 if include_gst else min_price_before_gst
-    
-    # Final price is higher of discounted price or minimum
-    final_selling_price = max(discounted_price, min_allowable_price)
-else:
-    final_selling_price = list_price
+    # Batch inputs in a form - the script reruns once on submit instead of once per field
+    with st.form("cost_inputs", clear_on_submit=False):
+        # Plant costs
+        plant_cost = st.number_input(
+            "Plant Cost ($)", 
+            min_value=0.0, 
+            value=5.0, 
+            step=0.50,
+            help=_PLANT_HELP
+        )
+
+        # Materials costs
+        st.subheader("Materials & Care")
+        pot_cost = st.number_input("Pot/Container ($)", min_value=0.0, value=2.0, step=0.25)
+        soil_cost = st.number_input("Soil/Growing Medium ($)", min_value=0.0, value=1.0, step=0.25)
+        fertilizer_cost = st.number_input("Fertilizer/Care Products ($)", min_value=0.0, value=0.50, step=0.25)
+        packaging_cost = st.number_input("Packaging/Shipping Materials ($)", min_value=0.0, value=1.50, step=0.25, 
+                                       help=_PACKAGING_HELP)
+        other_materials = st.number_input("Other Materials ($)", min_value=0.0, value=0.0, step=0.25)
+
+        # Time investment
+        st.subheader("Time Investment")
+        care_hours = st.number_input("Care/Prep Hours", min_value=0.0, value=1.0, step=0.25)
+        hourly_rate = st.number_input("Your Hourly Rate ($)", min_value=0.0, value=20.0, step=5.0)
+
+        # Pricing settings - ALL INPUT VARIABLES DEFINED HERE
+        st.subheader("Pricing Settings")
+        profit_margin = st.slider("Desired Profit Margin (%)", min_value=20, max_value=100, value=30, step=5)
+        sales_discount = st.slider("Sales Discount (%)", min_value=0, max_value=50, value=0, step=5,
+                                  help=_SALES_DISCOUNT_HELP)
+        minimum_sales_profit = st.slider("Minimum Sales Profit (%)", min_value=0, max_value=20, value=10, step=1,
+                                        help=_MIN_SALES_PROFIT_HELP)
+        include_gst = st.checkbox("Add GST (10%)", value=True, help=_GST_HELP)
+
+        st.form_submit_button("Recalculate")
 
-# Step 5: Calculate actual achieved margins
-if include_gst:
-    actual_price_before_gst = final_selling_price / 1.10
-    actual_gst = final_selling_price - actual_price_before_gst
+# ALL INPUT VARIABLES NOW DEFINED - START CALCULATIONS
+# Reuse the last result from session state when the inputs haven't changed
+pricing_key = (
+    plant_cost, pot_cost, soil_cost, fertilizer_cost, packaging_cost, other_materials,
+    care_hours, hourly_rate, profit_margin, sales_discount, minimum_sales_profit, include_gst
+)
+if st.session_state.get("_pricing_key") == pricing_key:
+    result = st.session_state["_pricing_result"]
 else:
-    actual_price_before_gst = final_selling_price
-    actual_gst = 0.0
-
-actual_profit = actual_price_before_gst - total_cost
-actual_margin = (actual_profit / actual_price_before_gst) * 100 if actual_price_before_gst > 0 else 0
+    result = compute_pricing(*pricing_key)
+    st.session_state["_pricing_key"] = pricing_key
+    st.session_state["_pricing_result"] = result
 
 with results_container:
     st.header("💡 Pricing Results")
     
     # Cost breakdown
     st.subheader("Cost Breakdown")
-    st.write(f"**Plant Cost:** ${plant_cost:.2f}")
-    st.write(f"**Materials:** ${total_material_cost:.2f}")
-    st.write(f"**Time ({care_hours}h):** ${time_cost:.2f}")
-    st.write("---")
-    st.write(f"**Total Cost:** ${total_cost:.2f}")
-    
+    # One markdown block per section - each st.write is a separate frontend message
+    cost_lines = [
+        f"**Plant Cost:** {_d(plant_cost)}",
+        f"**Materials:** {_d(result.total_material_cost)}",
+        f"**Time ({care_hours}h):** {_d(result.time_cost)}",
+        "---",
+        f"**Total Cost:** {_d(result.total_cost)}",
+    ]
+    st.markdown("\n\n".join(cost_lines))
+
     # Detailed breakdown (expandable)
     with st.expander("📋 Detailed Cost Breakdown"):
-        st.write(f"Plant: ${plant_cost:.2f}")
-        st.write(f"Pot/Container: ${pot_cost:.2f}")
-        st.write(f"Soil/Growing Medium: ${soil_cost:.2f}")
-        st.write(f"Fertilizer/Care: ${fertilizer_cost:.2f}")
-        st.write(f"Packaging/Shipping: ${packaging_cost:.2f}")
+        detail_lines = [
+            f"Plant: {_d(plant_cost)}",
+            f"Pot/Container: {_d(pot_cost)}",
+            f"Soil/Growing Medium: {_d(soil_cost)}",
+            f"Fertilizer/Care: {_d(fertilizer_cost)}",
+            f"Packaging/Shipping: {_d(packaging_cost)}",
+        ]
         if other_materials > 0:
-            st.write(f"Other Materials: ${other_materials:.2f}")
-        st.write(f"Time ({care_hours}h @ ${hourly_rate:.2f}/h): ${time_cost:.2f}")
-    
+            detail_lines.append(f"Other Materials: {_d(other_materials)}")
+        detail_lines.append(f"Time ({care_hours}h @ {_d(hourly_rate)}/h): {_d(result.time_cost)}")
+        st.markdown("\n\n".join(detail_lines))
+
     # Pricing recommendation
     st.subheader("Recommended Price")
     
     # Show pricing flow
     if sales_discount > 0:
-        st.write(f"**List Price:** ${list_price:.2f}")
-        st.write(f"**Discount ({sales_discount}%):** -${list_price - discounted_price:.2f}")
+        st.write(f"**List Price:** {_d(result.list_price)}")
+        st.write(f"**Discount ({sales_discount}%):** -{_d(result.list_price - result.discounted_price)}")
     
     if include_gst and sales_discount == 0:
-        st.write(f"**Price before GST:** ${base_selling_price:.2f}")
-        st.write(f"**GST (10%):** ${gst_amount:.2f}")
+        st.write(f"**Price before GST:** {_d(result.base_selling_price)}")
+        st.write(f"**GST (10%):** {_d(result.gst_amount)}")
     
     st.metric(
         label="Final Selling Price" + (" (inc GST)" if include_gst else ""), 
-        value=f"${final_selling_price:.2f}",
-        help=f"Achieves {actual_margin:.1f}% profit margin"
+        value=_d(result.final_selling_price),
+        help=f"Achieves {result.actual_margin:.1f}% profit margin"
     )
     
     st.metric(
         label="Actual Profit", 
-        value=f"${actual_profit:.2f}",
-        delta=f"{actual_margin:.1f}%"
+        value=_d(result.actual_profit),
+        delta=f"{result.actual_margin:.1f}%"
     )
     
     # Profit status
-    if actual_margin >= 20:
-        st.success(f"✅ {actual_margin:.1f}% margin meets target")
-    elif actual_margin >= minimum_sales_profit:
-        st.info(f"ℹ️ {actual_margin:.1f}% margin (sales pricing)")
-    elif actual_margin >= 0:
-        st.warning(f"⚠️ {actual_margin:.1f}% margin (low profit)")
+    if result.actual_margin >= 20:
+        st.success(f"✅ {result.actual_margin:.1f}% margin meets target")
+    elif result.actual_margin >= minimum_sales_profit:
+        st.info(f"ℹ️ {result.actual_margin:.1f}% margin (sales pricing)")
+    elif result.actual_margin >= 0:
+        st.warning(f"⚠️ {result.actual_margin:.1f}% margin (low profit)")
     else:
-        st.error(f"❌ {actual_margin:.1f}% margin (loss!)")
-
-# Market comparison section
-st.header("🔍 Market Comparison")
-st.write("Compare your price with local competitors")
-
-comp_col1, comp_col2, comp_col3 = st.columns(3)
-
-with comp_col1:
-    comp1_name = st.text_input("Competitor 1 Name", placeholder="Local Garden Center")
-    comp1_price = st.number_input("Their Price ($)", min_value=0.0, value=0.0, key="comp1")
-
-with comp_col2:
-    comp2_name = st.text_input("Competitor 2 Name", placeholder="Big Box Store")
-    comp2_price = st.number_input("Their Price ($)", min_value=0.0, value=0.0, key="comp2")
-
-with comp_col3:
-    comp3_name = st.text_input("Competitor 3 Name", placeholder="Online Retailer")
-    comp3_price = st.number_input("Their Price ($)", min_value=0.0, value=0.0, key="comp3")
-
-# Display comparison if any competitor prices entered
-competitors = []
-if comp1_price > 0:
-    competitors.append({"Name": comp1_name or "Competitor 1", "Price": comp1_price})
-if comp2_price > 0:
-    competitors.append({"Name": comp2_name or "Competitor 2", "Price": comp2_price})
-if comp3_price > 0:
-    competitors.append({"Name": comp3_name or "Competitor 3", "Price": comp3_price})
-
-if competitors:
-    st.subheader("Price Comparison")
-    comparison_data = competitors + [{"Name": "Your Price", "Price": final_selling_price}]
-    df = pd.DataFrame(comparison_data)
-    
-    # Sort by price for easy comparison
-    df_sorted = df.sort_values("Price")
-    st.dataframe(df_sorted, hide_index=True)
-    
-    # Market position analysis
-    st.subheader("Market Analysis")
-    avg_competitor_price = sum([c["Price"] for c in competitors]) / len(competitors)
-    
-    # Format prices clearly
-    your_price_text = f"${final_selling_price:.2f}"
-    avg_price_text = f"${avg_competitor_price:.2f}"
-    
-    if final_selling_price <= avg_competitor_price:
-        st.success(f"✅ **Competitive Pricing**")
-        st.write(f"Your price: {your_price_text}")
-        st.write(f"Average competitor: {avg_price_text}")
-    else:
-        price_diff = final_selling_price - avg_competitor_price
-        st.warning(f"⚠️ **Above Market**")
-        st.write(f"Your price: {your_price_text}")
-        st.write(f"Average competitor: {avg_price_text}")
-        st.write(f"You're ${price_diff:.2f} above average - consider if premium quality justifies this.")
-
-# Summary section - ALL VARIABLES PROPERLY DEFINED
-st.header("📋 Pricing Summary")
-
-gst_text = f" (inc GST ${actual_gst:.2f})" if include_gst and actual_gst > 0 else ""
-discount_text = f" (after {sales_discount}% discount)" if sales_discount > 0 else ""
-
-summary_text = f"""
+        st.error(f"❌ {result.actual_margin:.1f}% margin (loss!)")
+
+
+# Market comparison section - a fragment, so editing competitor inputs only reruns this block
+@st.fragment
+def render_market_comparison(result, plant_cost, packaging_cost, sales_discount, include_gst):
+    st.header("🔍 Market Comparison")
+    st.write("Compare your price with local competitors")
+
+    comp_col1, comp_col2, comp_col3 = st.columns(3)
+
+    with comp_col1:
+        comp1_name = st.text_input("Competitor 1 Name", placeholder="Local Garden Center")
+        comp1_price = st.number_input("Their Price ($)", min_value=0.0, value=0.0, key="comp1")
+
+    with comp_col2:
+        comp2_name = st.text_input("Competitor 2 Name", placeholder="Big Box Store")
+        comp2_price = st.number_input("Their Price ($)", min_value=0.0, value=0.0, key="comp2")
+
+    with comp_col3:
+        comp3_name = st.text_input("Competitor 3 Name", placeholder="Online Retailer")
+        comp3_price = st.number_input("Their Price ($)", min_value=0.0, value=0.0, key="comp3")
+
+    # Display comparison if any competitor prices entered
+    competitors = []
+    total_competitor_price = 0.0
+    competitor_inputs = ((comp1_name, comp1_price), (comp2_name, comp2_price), (comp3_name, comp3_price))
+    for i, (name, price) in enumerate(competitor_inputs, start=1):
+        if price > 0:
+            competitors.append({"Name": name or f"Competitor {i}", "Price": price})
+            total_competitor_price += price
+
+    if competitors:
+        st.subheader("Price Comparison")
+        comparison_data = competitors + [{"Name": "Your Price", "Price": result.final_selling_price}]
+
+        # Sort by price for easy comparison - a plain list is plenty for at most 4 rows
+        sorted_rows = sorted(comparison_data, key=itemgetter("Price"))
+        st.dataframe(sorted_rows, hide_index=True)
+
+        # Market position analysis
+        st.subheader("Market Analysis")
+        avg_competitor_price = total_competitor_price / len(competitors)
+
+        # Format prices clearly
+        your_price_text = _d(result.final_selling_price)
+        avg_price_text = _d(avg_competitor_price)
+
+        if result.final_selling_price <= avg_competitor_price:
+            st.success(f"✅ **Competitive Pricing**")
+            st.write(f"Your price: {your_price_text}")
+            st.write(f"Average competitor: {avg_price_text}")
+        else:
+            price_diff = result.final_selling_price - avg_competitor_price
+            st.warning(f"⚠️ **Above Market**")
+            st.write(f"Your price: {your_price_text}")
+            st.write(f"Average competitor: {avg_price_text}")
+            st.write(f"You're {_d(price_diff)} above average - consider if premium quality justifies this.")
+
+    # Summary section - ALL VARIABLES PROPERLY DEFINED
+    st.header("📋 Pricing Summary")
+
+    gst_text = f" (inc GST {_d(result.actual_gst)})" if include_gst and result.actual_gst > 0 else ""
+    discount_text = f" (after {sales_discount}% discount)" if sales_discount > 0 else ""
+
+    summary_text = f"""
 **Product Pricing Decision:**
-- **Final Selling Price:** ${final_selling_price:.2f}{gst_text}{discount_text}
-- **Total Cost:** ${total_cost:.2f}
-- **Actual Profit:** ${actual_profit:.2f} ({actual_margin:.1f}%)
-- **Cost Breakdown:** Plant ${plant_cost:.2f} + Materials ${total_material_cost:.2f} (incl. packaging ${packaging_cost:.2f}) + Time ${time_cost:.2f}
+- **Final Selling Price:** {_d(result.final_selling_price)}{gst_text}{discount_text}
+- **Total Cost:** {_d(result.total_cost)}
+- **Actual Profit:** {_d(result.actual_profit)} ({result.actual_margin:.1f}%)
+- **Cost Breakdown:** Plant {_d(plant_cost)} + Materials {_d(result.total_material_cost)} (incl. packaging {_d(packaging_cost)}) + Time {_d(result.time_cost)}
 """
 
-if competitors:
-    summary_text += f"\n- **Market Position:** Compared to {len(competitors)} competitors"
+    if competitors:
+        summary_text += f"\n- **Market Position:** Compared to {len(competitors)} competitors"
+
+    st.text_area("Copy this summary:", summary_text, height=150)
+
 
-st.text_area("Copy this summary:", summary_text, height=150)
\ No newline at end of file
+render_market_comparison(result, plant_cost, packaging_cost, sales_discount, include_gst)
@@ -0,0 +1,86 @@
+import numpy as np
+from numba import njit, prange
+
+
+# Mirrors compute_pricing in pricing_core.py operation for operation, so bulk results match the UI to the cent.
+# Keep the two in step - test_pricing_batch.py checks they agree.
+@njit(cache=True)
+def _compute_pricing_scalar(plant_cost, pot_cost, soil_cost, fertilizer_cost, packaging_cost, other_materials,
+                            care_hours, hourly_rate, profit_margin, sales_discount, minimum_sales_profit,
+                            include_gst_flag):
+    # Total costs
+    total_material_cost = pot_cost + soil_cost + fertilizer_cost + packaging_cost + other_materials
+    time_cost = care_hours * hourly_rate
+    total_cost = plant_cost + total_material_cost + time_cost
+
+    # List price (before discount)
+    base_selling_price = total_cost / (1 - profit_margin/100)
+    if include_gst_flag:
+        list_price = base_selling_price + base_selling_price * 0.10
+    else:
+        list_price = base_selling_price
+
+    # Discount, floored at the minimum sales profit
+    gst_mult = 1.10 if include_gst_flag else 1.0
+    discounted_price = list_price * (1 - sales_discount/100)
+    min_allowable_price = total_cost / (1 - minimum_sales_profit/100) * gst_mult
+    final_selling_price = max(discounted_price, min_allowable_price) if sales_discount > 0 else list_price
+
+    # Actual achieved margin
+    actual_price_before_gst = final_selling_price / 1.10 if include_gst_flag else final_selling_price
+    actual_profit = actual_price_before_gst - total_cost
+    actual_margin = (actual_profit / actual_price_before_gst) * 100 if actual_price_before_gst > 0 else 0.0
+
+    return total_cost, final_selling_price, actual_margin, actual_profit
+
+
+@njit(cache=True, parallel=True)
+def _compute_pricing_rows(plant_cost, pot_cost, soil_cost, fertilizer_cost, packaging_cost, other_materials,
+                          care_hours, hourly_rate, profit_margin, sales_discount, minimum_sales_profit,
+                          include_gst):
+    n = plant_cost.shape[0]
+    out = np.empty((n, 4))
+    for i in prange(n):
+        total_cost, final_selling_price, actual_margin, actual_profit = _compute_pricing_scalar(
+            plant_cost[i], pot_cost[i], soil_cost[i], fertilizer_cost[i], packaging_cost[i], other_materials[i],
+            care_hours[i], hourly_rate[i], profit_margin[i], sales_discount[i], minimum_sales_profit[i],
+            include_gst[i]
+        )
+        out[i, 0] = total_cost
+        out[i, 1] = final_selling_price
+        out[i, 2] = actual_margin
+        out[i, 3] = actual_profit
+    return out
+
+
+def compute_pricing_batch(plant_cost, pot_cost, soil_cost, fertilizer_cost, packaging_cost, other_materials,
+                          care_hours, hourly_rate, profit_margin, sales_discount, minimum_sales_profit,
+                          include_gst):
+    """Price many products at once - one array per input column, one row per product.
+
+    Returns an (n, 4) array of total cost, final selling price, actual margin (%) and actual profit.
+    Raises ValueError if the columns aren't all 1-D with the same length, or if any margin is
+    100% or more, since that price would be infinite.
+    """
+    columns = {
+        "plant_cost": plant_cost, "pot_cost": pot_cost, "soil_cost": soil_cost,
+        "fertilizer_cost": fertilizer_cost, "packaging_cost": packaging_cost,
+        "other_materials": other_materials, "care_hours": care_hours, "hourly_rate": hourly_rate,
+        "profit_margin": profit_margin, "sales_discount": sales_discount,
+        "minimum_sales_profit": minimum_sales_profit,
+    }
+    columns = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+    columns["include_gst"] = np.asarray(include_gst, dtype=np.bool_)
+
+    # The compiled loop doesn't bounds-check, so a short column would read past its end
+    n = columns["plant_cost"].shape[0] if columns["plant_cost"].ndim == 1 else None
+    for name, values in columns.items():
+        if values.ndim != 1 or values.shape[0] != n:
+            raise ValueError(f"{name} must be a 1-D column the same length as plant_cost")
+
+    if (columns["profit_margin"] >= 100).any():
+        raise ValueError("profit_margin must be below 100%")
+    if (columns["minimum_sales_profit"] >= 100).any():
+        raise ValueError("minimum_sales_profit must be below 100%")
+
+    return _compute_pricing_rows(*columns.values())
@@ -0,0 +1,69 @@
+from typing import NamedTuple
+
+import streamlit as st
+
+
+class PricingResult(NamedTuple):
+    total_material_cost: float
+    time_cost: float
+    total_cost: float
+    base_selling_price: float
+    gst_amount: float
+    list_price: float
+    discounted_price: float
+    final_selling_price: float
+    actual_gst: float
+    actual_profit: float
+    actual_margin: float
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def compute_pricing(plant_cost, pot_cost, soil_cost, fertilizer_cost, packaging_cost, other_materials,
+                    care_hours, hourly_rate, profit_margin, sales_discount, minimum_sales_profit, include_gst):
+    """Pure pricing math - cached so unrelated widget changes skip the recalculation."""
+    # Step 1: Calculate total costs
+    total_material_cost = pot_cost + soil_cost + fertilizer_cost + packaging_cost + other_materials
+    time_cost = care_hours * hourly_rate
+    total_cost = plant_cost + total_material_cost + time_cost
+
+    # Step 2: Calculate base selling price (before GST, before discount)
+    base_selling_price = total_cost / (1 - profit_margin/100)
+
+    # Step 3: Add GST to get list price
+    if include_gst:
+        gst_amount = base_selling_price * 0.10
+        list_price = base_selling_price + gst_amount
+    else:
+        gst_amount = 0.0
+        list_price = base_selling_price
+
+    # Step 4: Apply discount to list price, never going below the minimum sales profit
+    gst_mult = 1.10 if include_gst else 1.0
+    discounted_price = list_price * (1 - sales_discount/100)
+    min_allowable_price = total_cost / (1 - minimum_sales_profit/100) * gst_mult
+    final_selling_price = max(discounted_price, min_allowable_price) if sales_discount > 0 else list_price
+
+    # Step 5: Calculate actual achieved margins
+    if include_gst:
+        actual_price_before_gst = final_selling_price / 1.10
+        actual_gst = final_selling_price - actual_price_before_gst
+    else:
+        actual_price_before_gst = final_selling_price
+        actual_gst = 0.0
+
+    actual_profit = actual_price_before_gst - total_cost
+    actual_margin = (actual_profit / actual_price_before_gst) * 100 if actual_price_before_gst > 0 else 0
+
+    return PricingResult(
+        total_material_cost=total_material_cost,
+        time_cost=time_cost,
+        total_cost=total_cost,
+        base_selling_price=base_selling_price,
+        gst_amount=gst_amount,
+        list_price=list_price,
+        discounted_price=discounted_price,
+        final_selling_price=final_selling_price,
+        actual_gst=actual_gst,
+        actual_profit=actual_profit,
+        actual_margin=actual_margin,
+    )
@@ -0,0 +1,71 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("numba")
+
+import numpy as np
+
+from pricing_batch import compute_pricing_batch
+from pricing_core import compute_pricing
+
+GRID = list(itertools.product(
+    (0.0, 3.3, 5.0),            # plant_cost
+    (1.1, 2.0),                 # pot_cost
+    (1.0,),                     # soil_cost
+    (0.5,),                     # fertilizer_cost
+    (1.5,),                     # packaging_cost
+    (0.0, 2.2),                 # other_materials
+    (0.25, 1.0),                # care_hours
+    (20.0, 35.0),               # hourly_rate
+    (20, 30, 90, 95),           # profit_margin
+    (0, 15, 50),                # sales_discount
+    (0, 10, 17),                # minimum_sales_profit
+    (True, False),              # include_gst
+)) + [
+    # Rounds to a different cent if the GST step is computed as base * 1.10 instead of base + base * 0.10
+    (3.3, 1.1, 0.0, 0.0, 0.0, 2.2, 0.25, 35.0, 90, 15, 17, True),
+]
+
+
+def test_batch_matches_compute_pricing():
+    columns = [np.array(column) for column in zip(*GRID)]
+    out = compute_pricing_batch(*columns)
+
+    for row, (total_cost, final_selling_price, actual_margin, actual_profit) in zip(GRID, out):
+        expected = compute_pricing(*row)
+        assert total_cost == expected.total_cost, row
+        assert final_selling_price == expected.final_selling_price, row
+        assert actual_margin == expected.actual_margin, row
+        assert actual_profit == expected.actual_profit, row
+
+
+@pytest.mark.parametrize("field", ["profit_margin", "minimum_sales_profit"])
+def test_batch_rejects_margin_of_100_percent(field):
+    row = dict(
+        plant_cost=5.0, pot_cost=2.0, soil_cost=1.0, fertilizer_cost=0.5, packaging_cost=1.5,
+        other_materials=0.0, care_hours=1.0, hourly_rate=20.0, profit_margin=30, sales_discount=10,
+        minimum_sales_profit=10, include_gst=True,
+    )
+    row[field] = 100
+    with pytest.raises(ValueError, match=field):
+        compute_pricing_batch(**{name: np.array([value]) for name, value in row.items()})
+
+
+@pytest.mark.parametrize("field", ["pot_cost", "include_gst"])
+def test_batch_rejects_mismatched_column_lengths(field):
+    columns = {name: np.array(column) for name, column in zip(
+        ["plant_cost", "pot_cost", "soil_cost", "fertilizer_cost", "packaging_cost", "other_materials",
+         "care_hours", "hourly_rate", "profit_margin", "sales_discount", "minimum_sales_profit", "include_gst"],
+        zip(*GRID[:5]),
+    )}
+    columns[field] = columns[field][:1]
+    with pytest.raises(ValueError, match=field):
+        compute_pricing_batch(**columns)
+
+
+def test_batch_rejects_2d_columns():
+    columns = [np.array(column) for column in zip(*GRID[:4])]
+    columns[0] = columns[0].reshape(2, 2)
+    with pytest.raises(ValueError, match="plant_cost"):
+        compute_pricing_batch(*columns)